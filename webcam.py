@@ -1,15 +1,23 @@
 
 import cv2
 import easyocr
+import numpy as np
+import torch
 from ultralytics import YOLO
 import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 import threading
+import queue
 import time
 import webbrowser
 import json
 import os
+import argparse
+import bisect
+from array import array
+import platform
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from tkinter import font as tkfont
 
@@ -19,6 +27,20 @@ CONFIG = {
     "MODEL_CONFIDENCE": 0.25,
     "OCR_CONFIDENCE": 0.25,
     "DATABASE_FILE": "vehicle_database.json",
+    "ADMIN_PAGE_SIZE": 100,
+    "DATABASE_SAVE_DELAY": 0.5,   # Seconds to batch admin edits before saving
+    "RECORD_DIR": None,           # Each session is recorded into a new subdirectory
+    "REPLAY_DIR": None,           # Recording to replay instead of the camera
+    "REPLAY_SPEED": 1.0,          # 1.0 = real time, 0 = as fast as possible
+    "RECORD_CHUNK_FRAMES": 256,
+    "RECORD_QUEUE_FRAMES": 64,
+    "PERFORMANCE_PROFILE": "performance_profile.json",
+    "TORCH_THREADS": None,        # None = library default
+    "OPENCV_THREADS": None,       # None = library default
+    "OCR_WORKERS": 1,
+    "DETECTOR_IMGSZ": None,       # None = input size stored in best.pt
+    "AUTOTUNE_FRAMES": 30,
+    "AUTOTUNE_MAX_LATENCY_MS": 250,
     "THEME": {
         "bg_primary": "#1a1a2e",
         "bg_secondary": "#16213e",
@@ -33,10 +55,183 @@ CONFIG = {
 }
 
 # ================= VEHICLE DATABASE =================
+class RegistryIndex:
+    """Prefix and substring search over plate, origin and destination"""
+
+    FIELDS = ("from", "to")
+    MIN_SUBSTRING = 3   # Shorter substring queries are answered as prefix queries
+
+    def __init__(self, db):
+        # Removing a vehicle retires its id instead of rewriting postings
+        self._plates = []           # id -> plate, None once removed
+        self._ids = {}              # plate -> id
+        self.plate_trigrams = {}    # trigram -> array('I') of plate ids
+        # Origins and destinations repeat a lot, so only distinct values are indexed
+        self.value_ids = {field: {} for field in self.FIELDS}  # value -> array('I') of ids
+        self.value_trigrams = {}    # trigram -> set of (field, value)
+        
+        for plate, info in db.items():
+            self._insert(plate, info)
+        # Results are always in case-folded plate order
+        self.plates = sorted(self._ids, key=str.casefold)
+        self.plate_keys = [plate.casefold() for plate in self.plates]
+        self.sorted_values = {field: sorted(self.value_ids[field]) for field in self.FIELDS}
+
+    @staticmethod
+    def _trigrams(value):
+        return {value[i:i + 3] for i in range(len(value) - 2)}
+
+    def _insert(self, plate, info):
+        """Give a plate a new id and add it to the postings; return new values"""
+        plate_id = len(self._plates)
+        self._plates.append(plate)
+        self._ids[plate] = plate_id
+        
+        for gram in self._trigrams(plate.casefold()):
+            ids = self.plate_trigrams.get(gram)
+            if ids is None:
+                ids = self.plate_trigrams[gram] = array("I")
+            ids.append(plate_id)
+        
+        new_values = []
+        for field in self.FIELDS:
+            value = info[field].casefold()
+            if value not in self.value_ids[field]:
+                self.value_ids[field][value] = array("I")
+                for gram in self._trigrams(value):
+                    self.value_trigrams.setdefault(gram, set()).add((field, value))
+                new_values.append((field, value))
+            self.value_ids[field][value].append(plate_id)
+        return new_values
+
+    def add(self, plate, info):
+        """Index a vehicle, replacing any previous entry for the plate"""
+        self.remove(plate)
+        for field, value in self._insert(plate, info):
+            bisect.insort(self.sorted_values[field], value)
+        
+        key = plate.casefold()
+        i = bisect.bisect_left(self.plate_keys, key)
+        self.plate_keys.insert(i, key)
+        self.plates.insert(i, plate)
+
+    def remove(self, plate):
+        """Drop a vehicle from the index by retiring its id"""
+        plate_id = self._ids.pop(plate, None)
+        if plate_id is None:
+            return
+        self._plates[plate_id] = None
+        
+        i = bisect.bisect_left(self.plate_keys, plate.casefold())
+        del self.plate_keys[i]
+        del self.plates[i]
+
+    def _is_prefix(self, query, mode):
+        return mode == "prefix" or len(query) < self.MIN_SUBSTRING
+
+    def matches(self, plate, info, query, mode="substring"):
+        """Check whether a single indexed vehicle matches a query"""
+        if plate not in self._ids:
+            return False
+        query = query.strip().casefold()
+        keys = [plate.casefold()] + [info[field].casefold() for field in self.FIELDS]
+        if self._is_prefix(query, mode):
+            return any(key.startswith(query) for key in keys)
+        return any(query in key for key in keys)
+
+    def _trigram_candidates(self, postings, query):
+        """Intersect the postings of every trigram of the query, rarest first"""
+        grams = sorted(self._trigrams(query), key=lambda gram: len(postings.get(gram, ())))
+        found = set(postings.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not found:
+                break
+            found.intersection_update(postings.get(gram, ()))
+        return found
+
+    def search(self, query, mode="substring"):
+        """Return the plates whose plate, origin or destination match"""
+        query = query.strip().casefold()
+        if not query:
+            return list(self.plates)
+        
+        if self._is_prefix(query, mode):
+            start = bisect.bisect_left(self.plate_keys, query)
+            end = bisect.bisect_left(self.plate_keys, query + "\U0010ffff", start)
+            plates = self.plates[start:end]
+            values = []
+            for field in self.FIELDS:
+                distinct = self.sorted_values[field]
+                for value in distinct[bisect.bisect_left(distinct, query):]:
+                    if not value.startswith(query):
+                        break
+                    values.append((field, value))
+        else:
+            ids = self._trigram_candidates(self.plate_trigrams, query)
+            plates = [p for p in map(self._plates.__getitem__, ids)
+                      if p is not None and query in p.casefold()]
+            values = [(field, value) for field, value in
+                      self._trigram_candidates(self.value_trigrams, query) if query in value]
+        
+        if not values:
+            return sorted(plates, key=str.casefold)
+        
+        found = set(plates)
+        for field, value in values:
+            found.update(map(self._plates.__getitem__, self.value_ids[field][value]))
+        found.discard(None)
+        if len(found) * 4 > len(self.plates):
+            # Large result sets are cheaper to filter in order than to sort
+            return [plate for plate in self.plates if plate in found]
+        return sorted(found, key=str.casefold)
+
 class VehicleDatabase:
     def __init__(self, filename=CONFIG["DATABASE_FILE"]):
         self.filename = filename
         self.db = self.load_database()
+        
+        # The search index is built in the background so a large registry
+        # never blocks the UI; changes made meanwhile are replayed onto it
+        self._index = None
+        self.index_error = None
+        self._index_lock = threading.Lock()
+        self._pending_plates = []
+        threading.Thread(target=self._build_index, daemon=True).start()
+        
+        # Edits are saved by a background thread so rewriting a large
+        # registry never blocks the UI
+        self._save_lock = threading.Lock()
+        self._save_requested = threading.Event()
+        threading.Thread(target=self._save_loop, daemon=True).start()
+    
+    def _build_index(self):
+        try:
+            index = RegistryIndex(dict(self.db))
+            with self._index_lock:
+                for plate in self._pending_plates:
+                    if plate in self.db:
+                        index.add(plate, self.db[plate])
+                    else:
+                        index.remove(plate)
+                self._pending_plates = []
+                self._index = index
+        except Exception as e:
+            print(f"Error building search index: {e}")
+            self.index_error = e
+    
+    @property
+    def index(self):
+        """Search index over the registry, or None while it is being built"""
+        return self._index
+    
+    def _update_index(self, plate):
+        with self._index_lock:
+            if self._index is None:
+                self._pending_plates.append(plate)
+            elif plate in self.db:
+                self._index.add(plate, self.db[plate])
+            else:
+                self._index.remove(plate)
     
     def load_database(self):
         if os.path.exists(self.filename):
@@ -49,13 +244,28 @@ class VehicleDatabase:
         return {}
     
     def save_database(self):
-        try:
-            with open(self.filename, 'w') as f:
-                json.dump(self.db, f, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error saving database: {e}")
-            return False
+        with self._save_lock:
+            try:
+                db = dict(self.db)
+                with open(self.filename + ".tmp", 'w') as f:
+                    json.dump(db, f, indent=2)
+                os.replace(self.filename + ".tmp", self.filename)
+                return True
+            except Exception as e:
+                print(f"Error saving database: {e}")
+                return False
+    
+    def request_save(self):
+        """Save the database soon on the background thread"""
+        self._save_requested.set()
+    
+    def _save_loop(self):
+        while True:
+            self._save_requested.wait()
+            # Let a burst of edits settle into a single write
+            time.sleep(CONFIG["DATABASE_SAVE_DELAY"])
+            self._save_requested.clear()
+            self.save_database()
     
     def add_vehicle(self, plate, from_place, to_place):
         self.db[plate] = {
@@ -63,7 +273,9 @@ class VehicleDatabase:
             "to": to_place,
             "added_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
-        return self.save_database()
+        self._update_index(plate)
+        self.request_save()
+        return True
     
     def get_vehicle(self, plate):
         return self.db.get(plate)
@@ -71,7 +283,9 @@ class VehicleDatabase:
     def remove_vehicle(self, plate):
         if plate in self.db:
             del self.db[plate]
-            return self.save_database()
+            self._update_index(plate)
+            self.request_save()
+            return True
         return False
 
 # ================= HELPER FUNCTIONS =================
@@ -111,6 +325,39 @@ def get_ocr_text(image, bbox, reader, conf_thresh=CONFIG["OCR_CONFIDENCE"]):
     
     return best_text.strip()
 
+def create_models(status=print):
+    """Load the YOLO plate detector and the EasyOCR reader"""
+    status("Loading detection model...")
+    model = YOLO("best.pt")
+    model.overrides["verbose"] = False
+    
+    status("Loading OCR engine...")
+    reader = easyocr.Reader(["en"], gpu=False)
+    
+    return model, reader
+
+def create_ocr_pool(workers=None):
+    """Create the OCR worker pool, or None to run OCR inline"""
+    workers = CONFIG["OCR_WORKERS"] if workers is None else workers
+    if workers <= 1:
+        return None
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr")
+
+def detect_plates(frame, model, reader, ocr_pool=None):
+    """Detect plates in a frame and return a list of (bbox, raw_text)"""
+    options = {"conf": CONFIG["MODEL_CONFIDENCE"], "verbose": False}
+    if CONFIG["DETECTOR_IMGSZ"]:
+        options["imgsz"] = CONFIG["DETECTOR_IMGSZ"]
+    results = model.predict(frame, **options)
+    bboxes = [box.xyxy[0].cpu().numpy() for box in results[0].boxes or []]
+    
+    if ocr_pool:
+        texts = list(ocr_pool.map(lambda bbox: get_ocr_text(frame, bbox, reader), bboxes))
+    else:
+        texts = [get_ocr_text(frame, bbox, reader) for bbox in bboxes]
+    
+    return list(zip(bboxes, texts))
+
 def create_gradient(width, height, color1, color2):
     """Create gradient background"""
     from PIL import Image, ImageDraw
@@ -126,6 +373,366 @@ def create_gradient(width, height, color1, color2):
     
     return ImageTk.PhotoImage(image)
 
+# ================= FRAME RECORDING & REPLAY =================
+class FrameRecorder:
+    """Record raw camera frames and timestamps into a chunked, memory-mappable store"""
+
+    def __init__(self, directory, chunk_frames=CONFIG["RECORD_CHUNK_FRAMES"]):
+        # Never overwrite an earlier recording
+        if os.path.isdir(directory) and os.listdir(directory):
+            raise FileExistsError(f"Recording directory is not empty: {directory}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_frames = chunk_frames
+        self.chunks = []
+        self.frame_count = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        self._chunk_file = None
+        self._ts_file = open(os.path.join(directory, "timestamps.f64"), "wb")
+        self._start_time = None
+        
+        # Frames are written to disk on a separate thread so the detection
+        # loop never waits on I/O; the bounded queue only applies
+        # back-pressure when the disk cannot keep up
+        self._queue = queue.Queue(maxsize=CONFIG["RECORD_QUEUE_FRAMES"])
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def write(self, frame, timestamp=None):
+        """Queue a frame, timestamped relative to the first recorded frame"""
+        with self._lock:
+            if self.closed:
+                return
+            now = time.perf_counter() if timestamp is None else timestamp
+            if self._start_time is None:
+                self._start_time = now
+            self._queue.put((frame, now - self._start_time))
+
+    def _write_loop(self):
+        failed = False
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if failed:
+                # Keep draining so write() never blocks on a full queue
+                continue
+            try:
+                self._write_frame(*item)
+            except Exception as e:
+                print(f"Error recording frame: {e}")
+                failed = True
+
+    def _write_frame(self, frame, timestamp):
+        frame = np.ascontiguousarray(frame)
+        chunk = self.chunks[-1] if self.chunks else None
+        if (chunk is None or chunk["frames"] >= self.chunk_frames
+                or tuple(chunk["shape"]) != frame.shape
+                or chunk["dtype"] != frame.dtype.str):
+            self._start_chunk(frame)
+        
+        self._chunk_file.write(frame.data)
+        self._ts_file.write(np.float64(timestamp).tobytes())
+        self.chunks[-1]["frames"] += 1
+        self.frame_count += 1
+
+    def _start_chunk(self, frame):
+        """Close the current chunk and open a new one for frames like ``frame``"""
+        if self._chunk_file:
+            self._chunk_file.close()
+            self._ts_file.flush()
+            self._write_manifest()
+        
+        name = f"chunk_{len(self.chunks):05d}.raw"
+        self._chunk_file = open(os.path.join(self.directory, name), "wb")
+        self.chunks.append({
+            "file": name,
+            "shape": list(frame.shape),
+            "dtype": frame.dtype.str,
+            "frames": 0
+        })
+
+    def _write_manifest(self):
+        """Write the manifest atomically so a crash never leaves it half-written"""
+        manifest = {"version": 1, "frames": self.frame_count, "chunks": self.chunks}
+        path = os.path.join(self.directory, "manifest.json")
+        with open(path + ".tmp", 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def close(self):
+        """Write out queued frames and finalize the manifest"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+        self._queue.put(None)
+        self._writer.join()
+        
+        if self._chunk_file:
+            self._chunk_file.close()
+        self._ts_file.close()
+        self._write_manifest()
+
+def new_recording_dir(base):
+    """Return a fresh, timestamped session directory under ``base``"""
+    name = datetime.now().strftime("%Y%m%d_%H%M%S")
+    directory = os.path.join(base, name)
+    suffix = 1
+    while os.path.exists(directory):
+        directory = os.path.join(base, f"{name}_{suffix}")
+        suffix += 1
+    return directory
+
+class ReplayCapture:
+    """Drop-in replacement for ``cv2.VideoCapture`` that replays a recording"""
+
+    def __init__(self, directory, speed=CONFIG["REPLAY_SPEED"]):
+        with open(os.path.join(directory, "manifest.json"), 'r') as f:
+            manifest = json.load(f)
+        
+        # speed 1.0 replays in real time, 0 as fast as the pipeline can go
+        self.speed = speed
+        self.frame_count = manifest["frames"]
+        # Frames are read-only views into the mapped chunks, never copies
+        self.chunks = [
+            np.memmap(
+                os.path.join(directory, chunk["file"]),
+                dtype=np.dtype(chunk["dtype"]),
+                mode="r",
+                shape=(chunk["frames"], *chunk["shape"])
+            )
+            for chunk in manifest["chunks"] if chunk["frames"]
+        ]
+        self.timestamps = None
+        if self.frame_count:
+            self.timestamps = np.memmap(
+                os.path.join(directory, "timestamps.f64"),
+                dtype="<f8",
+                mode="r",
+                shape=(self.frame_count,)
+            )
+        
+        self.position = 0
+        self._chunk_index = 0
+        self._chunk_offset = 0
+        self._wall_start = None
+        self._opened = True
+
+    def isOpened(self):
+        return self._opened
+
+    def read(self):
+        """Return ``(True, frame)`` for the next frame or ``(False, None)`` at the end"""
+        if not self._opened or self.position >= self.frame_count:
+            return False, None
+        
+        chunk = self.chunks[self._chunk_index]
+        frame = chunk[self._chunk_offset]
+        
+        if self.speed:
+            if self._wall_start is None:
+                self._wall_start = time.perf_counter()
+            target = self.timestamps[self.position] / self.speed
+            delay = target - (time.perf_counter() - self._wall_start)
+            if delay > 0:
+                time.sleep(delay)
+        
+        self.position += 1
+        self._chunk_offset += 1
+        if self._chunk_offset >= len(chunk):
+            self._chunk_index += 1
+            self._chunk_offset = 0
+        
+        return True, frame
+
+    def release(self):
+        # The memmaps are left to the garbage collector: the detection
+        # thread may still be inside read() when this runs on the UI thread
+        self._opened = False
+
+# ================= PERFORMANCE TUNING =================
+PROFILE_KEYS = ("TORCH_THREADS", "OPENCV_THREADS", "OCR_WORKERS", "DETECTOR_IMGSZ")
+
+def apply_performance_settings():
+    """Apply the thread settings held in CONFIG to torch and OpenCV"""
+    if CONFIG["TORCH_THREADS"]:
+        torch.set_num_threads(CONFIG["TORCH_THREADS"])
+    if CONFIG["OPENCV_THREADS"] is not None:
+        cv2.setNumThreads(CONFIG["OPENCV_THREADS"])
+
+def current_host():
+    """Describe the CPU that performance settings are tuned for"""
+    return {
+        "cpu_count": os.cpu_count(),
+        "processor": platform.processor(),
+        "machine": platform.machine()
+    }
+
+def valid_profile_setting(key, value):
+    """Check a performance profile value before it reaches CONFIG"""
+    if key == "DETECTOR_IMGSZ" and value is None:
+        return True
+    if type(value) is not int or value < 1:
+        return False
+    return key != "DETECTOR_IMGSZ" or value % 32 == 0
+
+def load_performance_profile(filename=None):
+    """Merge a saved performance profile for this host into CONFIG"""
+    filename = filename or CONFIG["PERFORMANCE_PROFILE"]
+    if not os.path.exists(filename):
+        return False
+    try:
+        with open(filename, 'r') as f:
+            profile = json.load(f)
+        # Thread counts that suit one CPU can badly oversubscribe another
+        if profile.get("host") != current_host():
+            print(f"Ignoring performance profile {filename}: it was tuned on a different computer. "
+                  "Run with --autotune to create one for this computer.")
+            return False
+        settings = {key: value for key, value in profile["settings"].items() if key in PROFILE_KEYS}
+        for key, value in settings.items():
+            if not valid_profile_setting(key, value):
+                raise ValueError(f"invalid {key}: {value!r}")
+        CONFIG.update(settings)
+        return True
+    except Exception as e:
+        print(f"Error loading performance profile: {e}")
+        return False
+
+def save_performance_profile(settings, metrics, filename=None):
+    """Save tuned settings together with the host they were measured on"""
+    filename = filename or CONFIG["PERFORMANCE_PROFILE"]
+    profile = {
+        "host": current_host(),
+        "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "settings": settings,
+        "metrics": metrics
+    }
+    try:
+        with open(filename, 'w') as f:
+            json.dump(profile, f, indent=2)
+        return True
+    except Exception as e:
+        print(f"Error saving performance profile: {e}")
+        return False
+
+def open_clip(path):
+    """Open a recording directory or a video file as a frame source"""
+    if os.path.isdir(path):
+        return ReplayCapture(path, speed=0)
+    return cv2.VideoCapture(path)
+
+def benchmark_pipeline(frames, model, reader, settings):
+    """Return the throughput, p95 latency and per-frame detections of the pipeline"""
+    for key, value in settings.items():
+        CONFIG[key] = value
+    apply_performance_settings()
+    
+    ocr_pool = create_ocr_pool(settings["OCR_WORKERS"])
+    try:
+        # Warm-up so one-off allocations do not count against a candidate
+        detect_plates(frames[0], model, reader, ocr_pool)
+        
+        latencies = []
+        detections = []
+        total_start = time.perf_counter()
+        for frame in frames:
+            start = time.perf_counter()
+            found = detect_plates(frame, model, reader, ocr_pool)
+            latencies.append((time.perf_counter() - start) * 1000)
+            detections.append((len(found), sorted(normalize_plate(text) for _, text in found)))
+        total = time.perf_counter() - total_start
+    finally:
+        if ocr_pool:
+            ocr_pool.shutdown()
+    
+    latencies.sort()
+    return {
+        "fps": len(frames) / total,
+        "p95_latency_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    }, detections
+
+def autotune(clip, max_latency_ms=None, num_frames=None):
+    """Tune performance settings on a sample clip and save them as the profile"""
+    max_latency_ms = max_latency_ms or CONFIG["AUTOTUNE_MAX_LATENCY_MS"]
+    num_frames = num_frames or CONFIG["AUTOTUNE_FRAMES"]
+    
+    try:
+        cap = open_clip(clip)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Cannot open clip {clip}: not a valid recording ({e})")
+        return None
+    frames = []
+    while cap.isOpened() and len(frames) < num_frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.resize(frame, (800, 600)))
+    cap.release()
+    if not frames:
+        print(f"No frames could be read from {clip}")
+        return None
+    
+    model, reader = create_models()
+    
+    cpus = os.cpu_count() or 1
+    thread_options = sorted({1, 2, max(1, cpus // 2), cpus})
+    candidates = {
+        "TORCH_THREADS": thread_options,
+        "OPENCV_THREADS": thread_options,
+        "OCR_WORKERS": [n for n in (1, 2, 4) if n <= cpus],
+        "DETECTOR_IMGSZ": [320, 416, 512, 640]
+    }
+    
+    def score(metrics):
+        # Configurations within the latency ceiling always beat those outside it
+        if metrics["p95_latency_ms"] <= max_latency_ms:
+            return (1, metrics["fps"])
+        return (0, -metrics["p95_latency_ms"])
+    
+    saved_config = {key: CONFIG[key] for key in PROFILE_KEYS}
+    saved_threads = (torch.get_num_threads(), cv2.getNumThreads())
+    
+    best = dict(saved_config)
+    best["TORCH_THREADS"] = best["TORCH_THREADS"] or saved_threads[0]
+    best["OPENCV_THREADS"] = saved_threads[1] if best["OPENCV_THREADS"] is None else best["OPENCV_THREADS"]
+    
+    try:
+        best_metrics, reference = benchmark_pipeline(frames, model, reader, best)
+        print(f"Reference {best} -> {best_metrics['fps']:.2f} FPS, p95 {best_metrics['p95_latency_ms']:.0f} ms")
+        
+        # Coordinate descent: tune one knob at a time, keeping the best value
+        # before moving on. Candidates whose detections differ from the
+        # reference run (the current settings) are rejected outright.
+        for key, values in candidates.items():
+            for value in values:
+                if value == best[key]:
+                    continue
+                settings = dict(best, **{key: value})
+                metrics, detections = benchmark_pipeline(frames, model, reader, settings)
+                if detections != reference:
+                    print(f"{settings} -> rejected, detections differ from the reference")
+                    continue
+                print(f"{settings} -> {metrics['fps']:.2f} FPS, p95 {metrics['p95_latency_ms']:.0f} ms")
+                if score(metrics) > score(best_metrics):
+                    best, best_metrics = settings, metrics
+    finally:
+        CONFIG.update(saved_config)
+        torch.set_num_threads(saved_threads[0])
+        cv2.setNumThreads(saved_threads[1])
+    
+    if best_metrics["p95_latency_ms"] > max_latency_ms:
+        print(f"Warning: no configuration met the {max_latency_ms} ms latency ceiling")
+    
+    CONFIG.update(best)
+    apply_performance_settings()
+    if not save_performance_profile(best, best_metrics):
+        return None
+    print(f"Saved performance profile to {CONFIG['PERFORMANCE_PROFILE']}: {best}")
+    return best
+
 # ================= MAIN APPLICATION =================
 class NumberPlateApp:
     def __init__(self, root):
@@ -137,6 +744,7 @@ class NumberPlateApp:
         # Initialize variables
         self.running = False
         self.cap = None
+        self.recorder = None
         self.last_map_opened = ""
         self.vehicle_db = VehicleDatabase()
         self.theme = CONFIG["THEME"]
@@ -351,13 +959,7 @@ class NumberPlateApp:
         """Load AI models (lazy loading)"""
         if not self.model_loaded:
             try:
-                self.status_var.set("Loading detection model...")
-                self.model = YOLO("best.pt")
-                self.model.overrides["verbose"] = False
-                
-                self.status_var.set("Loading OCR engine...")
-                self.reader = easyocr.Reader(["en"], gpu=False)
-                
+                self.model, self.reader = create_models(self.status_var.set)
                 self.model_loaded = True
                 return True
             except Exception as e:
@@ -508,7 +1110,9 @@ class NumberPlateApp:
                 messagebox.showerror("Invalid Input", "Please enter both origin and destination")
                 return
             
-            if self.vehicle_db.add_vehicle(plate, from_place, to_place):
+            saved = self.vehicle_db.add_vehicle(plate, from_place, to_place)
+            self.update_database_row(plate)
+            if saved:
                 messagebox.showinfo("Success", f"Vehicle {plate} registered successfully!")
                 for entry in entries.values():
                     entry.delete(0, tk.END)
@@ -527,6 +1131,42 @@ class NumberPlateApp:
         view_frame = ttk.Frame(notebook)
         notebook.add(view_frame, text="👁️ View Database")
         
+        # Search bar
+        search_frame = tk.Frame(view_frame)
+        search_frame.pack(fill="x", padx=10, pady=(10, 0))
+        
+        tk.Label(search_frame, text="Search", font=self.body_font).pack(side="left")
+        
+        self.db_search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.db_search_var, font=self.body_font)
+        search_entry.pack(side="left", fill="x", expand=True, padx=10)
+        
+        self.db_search_mode = tk.StringVar(value="substring")
+        ttk.Combobox(
+            search_frame,
+            textvariable=self.db_search_mode,
+            values=("substring", "prefix"),
+            state="readonly",
+            width=10
+        ).pack(side="left")
+        
+        # Debounce searches so typing does not query on every keystroke
+        self.db_search_job = None
+        
+        def schedule_search(*_):
+            if self.db_search_job:
+                admin_window.after_cancel(self.db_search_job)
+            self.db_search_job = admin_window.after(200, self.refresh_database_list)
+        
+        def cancel_search(event):
+            if event.widget is admin_window and self.db_search_job:
+                admin_window.after_cancel(self.db_search_job)
+                self.db_search_job = None
+        
+        self.db_search_var.trace_add("write", schedule_search)
+        self.db_search_mode.trace_add("write", schedule_search)
+        admin_window.bind("<Destroy>", cancel_search, add="+")
+        
         # Database list with scrollbar
         list_frame = tk.Frame(view_frame)
         list_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -547,21 +1187,119 @@ class NumberPlateApp:
         self.db_listbox.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=self.db_listbox.yview)
         
-        self.refresh_database_list()
+        # Pagination and actions
+        nav_frame = tk.Frame(view_frame)
+        nav_frame.pack(fill="x", padx=10, pady=(0, 10))
+        
+        ttk.Button(
+            nav_frame,
+            text="◀ Prev",
+            command=lambda: self.show_database_page(self.db_page - 1)
+        ).pack(side="left")
+        
+        self.db_page_label = tk.Label(nav_frame, font=self.body_font)
+        self.db_page_label.pack(side="left", padx=10)
+        
+        ttk.Button(
+            nav_frame,
+            text="Next ▶",
+            command=lambda: self.show_database_page(self.db_page + 1)
+        ).pack(side="left")
         
-        # Refresh button
         ttk.Button(
-            view_frame,
+            nav_frame,
             text="🔄 Refresh List",
             command=self.refresh_database_list
-        ).pack(pady=10)
+        ).pack(side="right")
+        
+        ttk.Button(
+            nav_frame,
+            text="🗑 Remove Selected",
+            command=self.remove_selected_vehicle
+        ).pack(side="right", padx=10)
+        
+        self.db_page = 0
+        self.db_results = []
+        self.refresh_database_list()
+
+    def database_view_exists(self):
+        """Check whether the admin registry list is still on screen"""
+        return hasattr(self, "db_listbox") and bool(self.db_listbox.winfo_exists())
 
     def refresh_database_list(self):
-        """Refresh the database list display"""
+        """Re-run the current search and show its first page"""
+        self.db_search_job = None
+        if not self.database_view_exists():
+            return
+        
+        index = self.vehicle_db.index
+        if index is None:
+            self.db_results = []
+            self.db_listbox.delete(0, tk.END)
+            if self.vehicle_db.index_error:
+                self.db_page_label.config(text=f"Search index failed: {self.vehicle_db.index_error!r}")
+                return
+            self.db_page_label.config(text="Building search index…")
+            self.db_search_job = self.db_listbox.after(200, self.refresh_database_list)
+            return
+        
+        self.db_results = index.search(
+            self.db_search_var.get(),
+            self.db_search_mode.get()
+        )
+        self.show_database_page(0)
+
+    def show_database_page(self, page):
+        """Render only the rows of the requested page of search results"""
+        page_size = CONFIG["ADMIN_PAGE_SIZE"]
+        page_count = max(1, -(-len(self.db_results) // page_size))
+        self.db_page = min(max(page, 0), page_count - 1)
+        
+        start = self.db_page * page_size
         self.db_listbox.delete(0, tk.END)
-        for plate, info in self.vehicle_db.db.items():
+        for plate in self.db_results[start:start + page_size]:
+            info = self.vehicle_db.db[plate]
             entry = f"{plate:15} | From: {info['from']:20} | To: {info['to']:20}"
             self.db_listbox.insert(tk.END, entry)
+        
+        text = f"Page {self.db_page + 1} of {page_count} • {len(self.db_results)} vehicles"
+        query = self.db_search_var.get().strip()
+        if self.db_search_mode.get() == "substring" and 0 < len(query) < RegistryIndex.MIN_SUBSTRING:
+            text += f" • prefix matches (type {RegistryIndex.MIN_SUBSTRING}+ characters)"
+        self.db_page_label.config(text=text)
+
+    def update_database_row(self, plate):
+        """Add, update or drop a single plate in the current results without re-searching"""
+        index = self.vehicle_db.index
+        if index is None or not self.database_view_exists():
+            # A pending index build picks the change up when it finishes
+            return
+        
+        i = bisect.bisect_left(self.db_results, plate.casefold(), key=str.casefold)
+        listed = i < len(self.db_results) and self.db_results[i] == plate
+        info = self.vehicle_db.db.get(plate)
+        if info and index.matches(plate, info, self.db_search_var.get(), self.db_search_mode.get()):
+            if not listed:
+                self.db_results.insert(i, plate)
+        elif listed:
+            del self.db_results[i]
+        
+        self.show_database_page(self.db_page)
+
+    def remove_selected_vehicle(self):
+        """Remove the vehicle selected in the registry list"""
+        selection = self.db_listbox.curselection()
+        if not selection:
+            return
+        
+        plate = self.db_results[self.db_page * CONFIG["ADMIN_PAGE_SIZE"] + selection[0]]
+        if not messagebox.askyesno("Remove Vehicle", f"Remove vehicle {plate} from the database?"):
+            return
+        
+        saved = self.vehicle_db.remove_vehicle(plate)
+        self.update_database_row(plate)
+        if not saved:
+            messagebox.showerror("Error", "Failed to remove vehicle")
 
     # ================= CAMERA CONTROL =================
     def start_camera(self):
@@ -573,17 +1311,38 @@ class NumberPlateApp:
             return
         
         self.running = True
-        self.cap = cv2.VideoCapture(0)
+        if CONFIG["REPLAY_DIR"]:
+            try:
+                self.cap = ReplayCapture(CONFIG["REPLAY_DIR"], CONFIG["REPLAY_SPEED"])
+            except Exception as e:
+                messagebox.showerror("Replay Error", f"Cannot open recording: {str(e)}")
+                self.running = False
+                return
+        else:
+            self.cap = cv2.VideoCapture(0)
         
         if not self.cap.isOpened():
             messagebox.showerror("Camera Error", "Cannot open camera. Please check your camera connection.")
             self.running = False
             return
         
+        if CONFIG["RECORD_DIR"]:
+            try:
+                self.recorder = FrameRecorder(new_recording_dir(CONFIG["RECORD_DIR"]))
+            except Exception as e:
+                messagebox.showerror("Recording Error", f"Cannot start recording: {str(e)}")
+                self.cap.release()
+                self.cap = None
+                self.running = False
+                return
+        
         # Update UI state
         self.start_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
-        self.status_var.set("System Active • Detecting license plates...")
+        status = "System Active • Detecting license plates..."
+        if self.recorder:
+            status += f" • Recording to {self.recorder.directory}"
+        self.status_var.set(status)
         
         # Start detection thread
         self.detection_thread = threading.Thread(target=self.detection_loop, daemon=True)
@@ -595,6 +1354,9 @@ class NumberPlateApp:
         if self.cap:
             self.cap.release()
             self.cap = None
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
         
         # Update UI state
         self.start_btn.config(state="normal")
@@ -606,27 +1368,30 @@ class NumberPlateApp:
         """Main detection loop"""
         fps_counter = 0
         fps_timer = time.time()
+        cap = self.cap
+        recorder = self.recorder
+        # Replay paces itself; otherwise cap the loop at ~30 FPS
+        frame_interval = 0 if isinstance(cap, ReplayCapture) else 0.03
+        ocr_pool = create_ocr_pool()
         
-        while self.running and self.cap and self.cap.isOpened():
+        while self.running and cap.isOpened():
             start_time = time.time()
             
             # Capture frame
-            ret, frame = self.cap.read()
+            ret, frame = cap.read()
             if not ret:
                 break
             
+            if recorder:
+                recorder.write(frame)
+            
             # Resize for better performance
             frame = cv2.resize(frame, (800, 600))
             display_frame = frame.copy()
             
             # Run detection
             try:
-                results = self.model.predict(frame, conf=CONFIG["MODEL_CONFIDENCE"], verbose=False)
-                
-                for box in results[0].boxes or []:
-                    bbox = box.xyxy[0].cpu().numpy()
-                    raw_text = get_ocr_text(display_frame, bbox, self.reader)
-                    
+                for bbox, raw_text in detect_plates(frame, self.model, self.reader, ocr_pool):
                     if not raw_text:
                         continue
                     
@@ -680,7 +1445,15 @@ class NumberPlateApp:
             
             # Control frame rate
             elapsed = time.time() - start_time
-            time.sleep(max(0.03 - elapsed, 0))
+            time.sleep(max(frame_interval - elapsed, 0))
+        
+        if ocr_pool:
+            ocr_pool.shutdown(wait=False)
+        
+        # Release the UI once a replay runs out of frames, unless the
+        # session was already stopped (and maybe restarted) from the UI
+        if self.running and self.cap is cap and isinstance(cap, ReplayCapture):
+            self.root.after(0, self.stop_camera)
 
     def update_display(self, image):
         """Update the video display (must be called from main thread)"""
@@ -701,6 +1474,28 @@ class NumberPlateApp:
 
 # ================= APPLICATION ENTRY POINT =================
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Intelligent Vehicle Recognition System")
+    parser.add_argument("--record", metavar="DIR", help="record raw camera frames into DIR")
+    parser.add_argument("--replay", metavar="DIR", help="replay a recording instead of the camera")
+    parser.add_argument("--replay-speed", type=float, default=CONFIG["REPLAY_SPEED"],
+                        help="replay speed factor (1 = real time, 0 = as fast as possible)")
+    parser.add_argument("--autotune", metavar="CLIP",
+                        help="tune performance settings on a recording or video file and exit")
+    parser.add_argument("--max-latency-ms", type=float, default=CONFIG["AUTOTUNE_MAX_LATENCY_MS"],
+                        help="per-frame latency ceiling used by --autotune")
+    args = parser.parse_args()
+    
+    if args.autotune:
+        best = autotune(args.autotune, max_latency_ms=args.max_latency_ms)
+        raise SystemExit(0 if best else 1)
+    
+    load_performance_profile()
+    apply_performance_settings()
+    
+    CONFIG["RECORD_DIR"] = args.record
+    CONFIG["REPLAY_DIR"] = args.replay
+    CONFIG["REPLAY_SPEED"] = args.replay_speed
+    
     root = tk.Tk()
     
     # Set application icon (if available)